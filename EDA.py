@@ -1,5 +1,4 @@
 import customtkinter as ctk
-import tkinter as tk
 from tkinter import filedialog, messagebox
 import pandas as pd
 import numpy as np
@@ -8,17 +7,209 @@ import time
 import os
 from datetime import datetime
 import io
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.lib import colors
-from reportlab.lib.enums import TA_CENTER, TA_LEFT
-import matplotlib.pyplot as plt
-import seaborn as sns
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import base64
-from io import BytesIO
+import csv
+import functools
+import importlib.util
+import hashlib
+import pickle
+
+# Minimum seconds between progress bar updates (caps redraws at 20 per second)
+UI_UPDATE_INTERVAL = 0.05
+
+# Bytes inspected when sniffing the delimiter of a .txt file
+SNIFF_BYTES = 8192
+
+# Rows of a CSV/TXT file read at upload; the rest is loaded when analysis starts
+PREVIEW_ROWS = 5000
+
+# Polars speeds up the analysis when installed; it is only imported once an analysis runs
+POLARS_AVAILABLE = importlib.util.find_spec("polars") is not None
+
+# Use the Rust-based calamine reader for Excel files when it is installed
+EXCEL_ENGINE = "calamine" if importlib.util.find_spec("python_calamine") else None
+
+# On-disk cache of analysis results; bump the version whenever the results layout changes
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "quickeda")
+CACHE_VERSION = "3"
+FINGERPRINT_BYTES = 1024 * 1024
+
+# Correlations are skipped above this many numeric columns and computed on a
+# random row sample for longer frames
+CORR_MAX_COLUMNS = 100
+CORR_SAMPLE_ROWS = 50_000
+
+# Percentage of the analysis bar used by loading the full dataset
+LOAD_PROGRESS_SHARE = 10
+
+# Rows sampled from each string column when estimating memory usage
+MEMORY_SAMPLE_ROWS = 1000
+
+class ProgressFile(io.FileIO):
+    """Binary file that reports how much of it has been read, at most every UI_UPDATE_INTERVAL and at EOF"""
+    def __init__(self, file_path, progress_callback):
+        super().__init__(file_path, 'rb')
+        self.total = os.path.getsize(file_path)
+        self.progress_callback = progress_callback
+        self.last_update = 0.0
+    
+    def report_progress(self, at_eof):
+        now = time.monotonic()
+        if self.total and (at_eof or now - self.last_update >= UI_UPDATE_INTERVAL):
+            self.last_update = now
+            self.progress_callback(min(self.tell() / self.total, 1))
+    
+    def read(self, size=-1):
+        data = super().read(size)
+        self.report_progress(not data)
+        return data
+    
+    def readinto(self, buffer):
+        count = super().readinto(buffer)
+        self.report_progress(not count)
+        return count
+
+def read_csv_fast(source, **kwargs):
+    """Parse a delimited binary file with the pyarrow engine, falling back to the C engine"""
+    try:
+        return pd.read_csv(source, engine='pyarrow', **kwargs)
+    except Exception:
+        source.seek(0)
+        return pd.read_csv(source, **kwargs)
+
+def sniff_delimiter(head):
+    """Guess the delimiter of a text file from its first few KB"""
+    sample = bytes(head[:SNIFF_BYTES]).decode('utf-8', errors='ignore')
+    try:
+        return csv.Sniffer().sniff(sample, delimiters=',\t;|').delimiter
+    except csv.Error:
+        # Single-column or irregular files: fall back to tab separated
+        return '\t'
+
+def read_txt_fast(source, **kwargs):
+    """Parse a delimited binary text file, sniffing the delimiter from the first few KB"""
+    sep = sniff_delimiter(source.read(SNIFF_BYTES))
+    source.seek(0)
+    return read_csv_fast(source, sep=sep, **kwargs)
+
+def read_text_preview(file_path, nrows):
+    """Read only the first rows of a CSV/TXT file straight from disk"""
+    sep = ','
+    if file_path.lower().endswith('.txt'):
+        with open(file_path, 'rb') as f:
+            sep = sniff_delimiter(f.read(SNIFF_BYTES))
+    return pd.read_csv(file_path, sep=sep, nrows=nrows)
+
+def read_excel_file(file_path):
+    """Read an Excel workbook from disk, preferring calamine when it is installed"""
+    return pd.read_excel(file_path, engine=EXCEL_ENGINE)
+
+# Text formats are parsed from an open binary file so reads can be tracked;
+# binary formats are read from the path
+TEXT_READERS = {
+    '.csv': read_csv_fast,
+    '.txt': read_txt_fast,
+}
+PATH_READERS = {
+    '.xlsx': read_excel_file,
+    '.xls': read_excel_file,
+}
+
+def downcast_numeric(df):
+    """Shrink numeric columns to the narrowest dtype that holds their values exactly"""
+    for col in df.select_dtypes(include=[np.integer]).columns:
+        df[col] = pd.to_numeric(df[col], downcast='integer')
+    for col in df.select_dtypes(include=[np.float64]).columns:
+        # Only narrow floats that survive the float32 round-trip unchanged
+        narrowed = df[col].astype(np.float32)
+        if narrowed.astype(np.float64).equals(df[col]):
+            df[col] = narrowed
+    return df
+
+def table_col_widths(rows, font_size, max_width):
+    """Size table columns from their longest cell so ReportLab can skip auto-width layout"""
+    lengths = np.char.str_len(np.asarray(rows, dtype=str)).max(axis=0)
+    # ~0.6em per Helvetica glyph plus the default 6pt cell padding on each side
+    widths = lengths * font_size * 0.6 + 12
+    if widths.sum() > max_width:
+        widths = widths * (max_width / widths.sum())
+    return widths.tolist()
+
+@functools.lru_cache(maxsize=None)
+def report_styles():
+    """Build the report paragraph styles once, on the first report"""
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib import colors
+    from reportlab.lib.enums import TA_CENTER
+    
+    styles = getSampleStyleSheet()
+    
+    title_style = ParagraphStyle(
+        'CustomTitle',
+        parent=styles['Title'],
+        fontSize=24,
+        spaceAfter=30,
+        alignment=TA_CENTER
+    )
+    
+    heading_style = ParagraphStyle(
+        'CustomHeading',
+        parent=styles['Heading1'],
+        fontSize=16,
+        spaceBefore=20,
+        spaceAfter=10,
+        textColor=colors.HexColor('#1f77b4')
+    )
+    
+    return styles, title_style, heading_style
+
+@functools.lru_cache(maxsize=None)
+def table_styles():
+    """Build the report table styles once and share them across every table"""
+    from reportlab.platypus import TableStyle
+    from reportlab.lib import colors
+    
+    header_style = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 12),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black)
+    ])
+    
+    # Larger tables use smaller fonts; later commands override the header style's
+    column_style = TableStyle(header_style.getCommands() + [
+        ('FONTSIZE', (0, 0), (-1, 0), 10),
+        ('FONTSIZE', (0, 1), (-1, -1), 8)
+    ])
+    numeric_style = TableStyle(header_style.getCommands() + [
+        ('FONTSIZE', (0, 0), (-1, 0), 8),
+        ('FONTSIZE', (0, 1), (-1, -1), 7)
+    ])
+    
+    top_values_style = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 9),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black)
+    ])
+    
+    return header_style, column_style, numeric_style, top_values_style
+
+def file_fingerprint(file_path):
+    """Fingerprint a file from its size, mtime and first/last megabyte"""
+    stat = os.stat(file_path)
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(f"{CACHE_VERSION}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+    with open(file_path, 'rb') as f:
+        digest.update(f.read(FINGERPRINT_BYTES))
+        if stat.st_size > FINGERPRINT_BYTES:
+            f.seek(max(FINGERPRINT_BYTES, stat.st_size - FINGERPRINT_BYTES))
+            digest.update(f.read())
+    return digest.hexdigest()
 
 # Set the theme and color theme
 ctk.set_appearance_mode("dark")
@@ -70,12 +261,36 @@ class ToastNotification:
         self.toast.destroy()
 
 class EDAAnalyzer:
-    def __init__(self, df):
-        self.df = df
+    def __init__(self, df, file_path=None, load_df=None):
+        # Shallow copy so dtype conversions don't leak back into the caller's frame
+        self.df = df.copy(deep=False) if df is not None else None
         self.analysis_results = {}
+        
+        # Without a df, load_df() fetches the data, but only when nothing is cached
+        self.load_df = load_df
+        self.loaded_df = None
+        
+        # Results are only cached when we know which file the data came from
+        self.cache_key = None
+        if file_path:
+            try:
+                self.cache_key = file_fingerprint(file_path)
+            except OSError:
+                pass
     
     def perform_analysis(self, progress_callback=None):
         """Perform comprehensive EDA analysis with progress updates"""
+        cached = self.load_cached_results()
+        if cached is not None:
+            if progress_callback:
+                progress_callback(100, "Loaded cached analysis results!")
+            self.analysis_results = cached
+            return cached
+        
+        if self.df is None:
+            self.loaded_df = self.load_df()
+            self.df = self.loaded_df.copy(deep=False)
+        
         results = {}
         
         # Step 1: Basic info
@@ -84,44 +299,220 @@ class EDAAnalyzer:
         results['shape'] = self.df.shape
         results['columns'] = list(self.df.columns)
         results['dtypes'] = self.df.dtypes.to_dict()
-        results['memory_usage'] = self.df.memory_usage(deep=True).sum()
+        results['memory_usage'], results['memory_estimated'] = self.estimate_memory_usage()
+        
+        # Later steps hash and count string values, which is much cheaper on category codes
+        self.convert_strings_to_category()
         
         # Step 2: Missing values
         if progress_callback:
             progress_callback(25, "Checking for missing values...")
-        results['missing_values'] = self.df.isnull().sum().to_dict()
-        results['missing_percentage'] = (self.df.isnull().sum() / len(self.df) * 100).to_dict()
+        missing = self.df.isnull().sum()
+        n_rows = len(self.df)
+        results['missing_values'] = missing.to_dict()
+        results['missing_percentage'] = (missing * (100.0 / n_rows) if n_rows else missing * 0.0).to_dict()
         
         # Step 3: Numerical columns analysis
         if progress_callback:
             progress_callback(50, "Analyzing numerical columns...")
         numeric_cols = self.df.select_dtypes(include=[np.number]).columns.tolist()
+        lazy_df = self.to_polars()
         if numeric_cols:
-            results['numeric_summary'] = self.df[numeric_cols].describe().to_dict()
-            results['correlation_matrix'] = self.df[numeric_cols].corr().to_dict()
+            corr_df = self.correlation_source(numeric_cols)
+            if lazy_df is not None:
+                numeric_summary, correlation_matrix = self.numeric_summary_polars(lazy_df, numeric_cols, corr_df)
+                results['numeric_summary'] = numeric_summary
+            else:
+                results['numeric_summary'] = self.df[numeric_cols].describe().to_dict()
+                correlation_matrix = None
+                if corr_df is not None:
+                    corr = corr_df.corr().to_numpy()
+                    correlation_matrix = {
+                        'cols': numeric_cols,
+                        'tri': corr[np.tril_indices_from(corr)]
+                    }
+            if correlation_matrix is not None:
+                results['correlation_matrix'] = correlation_matrix
         
         # Step 4: Categorical columns analysis
         if progress_callback:
             progress_callback(75, "Analyzing categorical columns...")
-        cat_cols = self.df.select_dtypes(include=['object', 'category']).columns.tolist()
+        cat_cols = self.df.select_dtypes(include=['object', 'string', 'category']).columns.tolist()
         if cat_cols:
-            results['categorical_summary'] = {}
-            for col in cat_cols:
-                results['categorical_summary'][col] = {
-                    'unique_count': self.df[col].nunique(),
-                    'top_values': self.df[col].value_counts().head(10).to_dict()
-                }
+            if lazy_df is not None:
+                results['categorical_summary'] = self.categorical_summary_polars(lazy_df, cat_cols)
+            else:
+                results['categorical_summary'] = {}
+                for col in cat_cols:
+                    # One hash aggregation gives both the unique count and a partial top-10 sort
+                    counts = self.df.groupby(col, sort=False, observed=True).size()
+                    results['categorical_summary'][col] = {
+                        'unique_count': counts.size,
+                        'top_values': counts.nlargest(10).to_dict()
+                    }
         
         # Step 5: Duplicate rows
         if progress_callback:
             progress_callback(90, "Checking for duplicate rows...")
-        results['duplicate_rows'] = self.df.duplicated().sum()
+        if lazy_df is not None:
+            results['duplicate_rows'] = self.duplicate_rows_polars(lazy_df)
+        else:
+            results['duplicate_rows'] = self.df.duplicated().sum()
         
         if progress_callback:
             progress_callback(100, "Analysis complete!")
         
         self.analysis_results = results
+        self.save_cached_results(results)
         return results
+    
+    def estimate_memory_usage(self):
+        """Return (bytes, estimated), sampling string columns instead of walking every value"""
+        n_rows = len(self.df)
+        # Only Python-object storage needs a deep walk; Arrow-backed strings are exact without one
+        object_cols = [
+            col for col, dtype in self.df.dtypes.items()
+            if dtype == object or getattr(dtype, 'storage', None) == 'python'
+        ]
+        if n_rows <= MEMORY_SAMPLE_ROWS or len(object_cols) == 0:
+            return int(self.df.memory_usage(deep=True).sum()), False
+        
+        usage = self.df.memory_usage(deep=False).astype(float)
+        sample = self.df[object_cols].sample(n=MEMORY_SAMPLE_ROWS, random_state=0)
+        scale = n_rows / MEMORY_SAMPLE_ROWS
+        for col in object_cols:
+            usage[col] = sample[col].memory_usage(index=False, deep=True) * scale
+        return int(usage.sum()), True
+    
+    def convert_strings_to_category(self):
+        """Convert low-cardinality string columns to the category dtype"""
+        n_rows = len(self.df)
+        for col in self.df.select_dtypes(include=['object', 'string']).columns:
+            series = self.df[col]
+            if series.nunique(dropna=False) < max(1000, n_rows // 2):
+                self.df[col] = series.astype('category')
+    
+    def cache_path(self):
+        """Path of the cache file for this dataset"""
+        return os.path.join(CACHE_DIR, f"{self.cache_key}.pkl")
+    
+    def load_cached_results(self):
+        """Load previously computed results for this dataset, or None on a miss"""
+        if self.cache_key is None:
+            return None
+        try:
+            with open(self.cache_path(), 'rb') as f:
+                return pickle.load(f)
+        except Exception:
+            # Missing, unreadable or stale cache entries are simply recomputed
+            return None
+    
+    def save_cached_results(self, results):
+        """Store results on disk so re-analysing the same file is instant"""
+        if self.cache_key is None:
+            return
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            with open(self.cache_path(), 'wb') as f:
+                pickle.dump(results, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            pass
+    
+    def to_polars(self):
+        """Convert the dataframe to a Polars LazyFrame, or None if Polars can't be used"""
+        if not POLARS_AVAILABLE or not all(isinstance(col, str) for col in self.df.columns):
+            return None
+        import polars as pl
+        try:
+            return pl.from_pandas(self.df).lazy()
+        except Exception:
+            # e.g. object columns holding mixed Python types
+            return None
+    
+    def duplicate_rows_polars(self, lazy_df):
+        """Count duplicate rows with a single Polars hash aggregation"""
+        import polars as pl
+        unique_rows = lazy_df.unique().select(pl.len()).collect().item()
+        return len(self.df) - unique_rows
+    
+    def correlation_source(self, numeric_cols):
+        """Rows to correlate: None for too many columns, a random sample for very long frames"""
+        if len(numeric_cols) > CORR_MAX_COLUMNS:
+            return None
+        if len(self.df) > CORR_SAMPLE_ROWS:
+            return self.df[numeric_cols].sample(n=CORR_SAMPLE_ROWS, random_state=0)
+        return self.df[numeric_cols]
+    
+    def numeric_summary_polars(self, lazy_df, numeric_cols, corr_df):
+        """Compute describe()-style stats and correlations in one parallel Polars run"""
+        import polars as pl
+        numeric_df = lazy_df.select(numeric_cols).cast(pl.Float64)
+        stats = {
+            'count': pl.all().count(),
+            'mean': pl.all().mean(),
+            'std': pl.all().std(),
+            'min': pl.all().min(),
+            '25%': pl.all().quantile(0.25, interpolation='linear'),
+            '50%': pl.all().median(),
+            '75%': pl.all().quantile(0.75, interpolation='linear'),
+            'max': pl.all().max(),
+        }
+        
+        # Pairwise correlations over the lower triangle (np.tril_indices order), aliased by index
+        pairs = [(i, j) for i in range(len(numeric_cols)) for j in range(i + 1)]
+        corr_exprs = [
+            pl.corr(numeric_cols[i], numeric_cols[j]).alias(f"{i}_{j}") for i, j in pairs
+        ]
+        
+        queries = [numeric_df.select(expr) for expr in stats.values()]
+        if corr_df is not None:
+            # Reuse the lazy frame unless correlations run on a row sample
+            if len(corr_df) == len(self.df):
+                corr_source = numeric_df
+            else:
+                corr_source = pl.from_pandas(corr_df).lazy().cast(pl.Float64)
+            queries.append(corr_source.select(corr_exprs))
+        frames = pl.collect_all(queries)
+        
+        numeric_summary = {col: {} for col in numeric_cols}
+        for stat, frame in zip(stats, frames):
+            row = frame.row(0, named=True)
+            for col in numeric_cols:
+                numeric_summary[col][stat] = row[col]
+        
+        correlation_matrix = None
+        if corr_df is not None:
+            corr_row = frames[-1].row(0, named=True)
+            correlation_matrix = {
+                'cols': numeric_cols,
+                'tri': np.array([corr_row[f"{i}_{j}"] for i, j in pairs], dtype=np.float64)
+            }
+        
+        return numeric_summary, correlation_matrix
+    
+    def categorical_summary_polars(self, lazy_df, cat_cols):
+        """Compute unique counts and top values for all categorical columns in parallel"""
+        import polars as pl
+        queries = []
+        for col in cat_cols:
+            # Both queries share the same group_by, which Polars computes only once
+            count_name = f"{col}_count"
+            counts = (
+                lazy_df.select(col).filter(pl.col(col).is_not_null())
+                .group_by(col).agg(pl.len().alias(count_name))
+            )
+            queries.append(counts.select(pl.len()))
+            queries.append(counts.sort(count_name, descending=True).limit(10))
+        frames = pl.collect_all(queries)
+        
+        categorical_summary = {}
+        for idx, col in enumerate(cat_cols):
+            unique_frame, top_frame = frames[2 * idx], frames[2 * idx + 1]
+            categorical_summary[col] = {
+                'unique_count': unique_frame.item(),
+                'top_values': dict(zip(top_frame[col].to_list(), top_frame[f"{col}_count"].to_list()))
+            }
+        return categorical_summary
 
 class QuickEDAApp:
     def __init__(self):
@@ -133,9 +524,11 @@ class QuickEDAApp:
         # App state
         self.uploaded_file_path = None
         self.df = None
+        self.preview_df = None
         self.analysis_results = None
         self.report_generated = False
         self.analysis_in_progress = False
+        self.report_in_progress = False
         
         self.setup_ui()
     
@@ -338,7 +731,7 @@ class QuickEDAApp:
             self.upload_progress.pack(pady=10)
             self.upload_progress.set(0)
             
-            # Simulate upload progress in a separate thread
+            # Load the file in a separate thread
             thread = threading.Thread(target=self.process_upload, args=(file_path,))
             thread.daemon = True
             thread.start()
@@ -346,24 +739,27 @@ class QuickEDAApp:
     def process_upload(self, file_path):
         """Process file upload with progress"""
         try:
-            # Simulate progress
-            for i in range(101):
-                self.upload_progress.set(i / 100)
-                time.sleep(0.01)  # Small delay for visual effect
-            
-            # Load the file
             file_ext = os.path.splitext(file_path)[1].lower()
+            self.root.after(0, self.start_indeterminate_upload_progress)
             
-            if file_ext == '.csv':
-                self.df = pd.read_csv(file_path)
-            elif file_ext in ['.xlsx', '.xls']:
-                self.df = pd.read_excel(file_path)
-            elif file_ext == '.txt':
-                # Try to read as CSV first, then as plain text
-                try:
-                    self.df = pd.read_csv(file_path, sep='\t')
-                except:
-                    self.df = pd.read_csv(file_path)
+            if file_ext in PATH_READERS:
+                # Excel can't be read partially, so load the whole workbook now
+                self.df = PATH_READERS[file_ext](file_path)
+                # Narrower numbers halve the memory traffic of describe/corr on wide frames
+                downcast_numeric(self.df)
+                self.preview_df = self.df
+            elif file_ext in TEXT_READERS:
+                # Only preview text files; the full data is loaded when analysis starts
+                self.preview_df = read_text_preview(file_path, PREVIEW_ROWS)
+                self.df = None
+                if len(self.preview_df) < PREVIEW_ROWS:
+                    # Small files are parsed now, with the same reader a full load would use
+                    # so their types match those inferred for large files
+                    with open(file_path, 'rb') as f:
+                        self.df = downcast_numeric(TEXT_READERS[file_ext](f))
+                    self.preview_df = self.df
+            else:
+                raise ValueError(f"Unsupported file type: {file_ext or 'no extension'}")
             
             self.uploaded_file_path = file_path
             
@@ -371,18 +767,66 @@ class QuickEDAApp:
             self.root.after(0, self.upload_success)
             
         except Exception as e:
-            self.root.after(0, lambda: self.upload_error(str(e)))
+            self.root.after(0, self.upload_error, str(e))
     
-    def upload_success(self):
-        """Handle successful upload"""
-        filename = os.path.basename(self.uploaded_file_path)
-        rows, cols = self.df.shape
-        
-        self.file_info_label.configure(
-            text=f"✅ {filename} ({rows:,} rows, {cols} columns)"
+    def load_full_dataset(self, file_path, preview_df):
+        """Parse the whole uploaded text file, showing read progress on the analysis bar"""
+        # The load fills the bar up to where the first analysis step starts
+        on_progress = lambda fraction: self.root.after(
+            0, self.update_analysis_progress,
+            fraction * LOAD_PROGRESS_SHARE, f"Loading full dataset... {fraction:.0%}"
         )
+        on_progress(0)
+        file_ext = os.path.splitext(file_path)[1].lower()
+        reader = TEXT_READERS[file_ext]
         
+        # Float columns seen in the preview skip pandas' type inference on the full read
+        dtype_hints = {
+            col: 'float64' for col in preview_df.select_dtypes(include=[np.floating]).columns
+        }
+        
+        # pandas reads straight from the file, so the raw bytes are never held in memory
+        with ProgressFile(file_path, on_progress) as f:
+            try:
+                df = reader(f, dtype=dtype_hints)
+            except (ValueError, TypeError):
+                # Later rows didn't fit the preview's types, so let pandas infer them
+                f.seek(0)
+                df = reader(f)
+        on_progress(1)
+        
+        # Narrower numbers halve the memory traffic of describe/corr on wide frames
+        return downcast_numeric(df)
+    
+    def start_indeterminate_upload_progress(self):
+        """Show an indeterminate upload progress bar"""
+        self.upload_progress.configure(mode="indeterminate")
+        self.upload_progress.start()
+    
+    def stop_upload_progress(self):
+        """Hide the upload progress bar and restore determinate mode"""
+        self.upload_progress.stop()
+        self.upload_progress.configure(mode="determinate")
         self.upload_progress.pack_forget()
+    
+    def update_file_info(self, shape=None):
+        """Show the uploaded file's shape, or its preview until fully loaded"""
+        filename = os.path.basename(self.uploaded_file_path)
+        if self.df is not None:
+            shape = self.df.shape
+        if shape is not None:
+            rows, cols = shape
+            text = f"✅ {filename} ({rows:,} rows, {cols} columns)"
+        else:
+            rows, cols = self.preview_df.shape
+            text = f"✅ {filename} (previewing first {rows:,} rows, {cols} columns)"
+        self.file_info_label.configure(text=text)
+    
+    def upload_success(self):
+        """Handle successful upload"""
+        self.update_file_info()
+        
+        self.stop_upload_progress()
         self.remove_file_btn.pack(pady=5)
         
         # Enable analysis button
@@ -394,13 +838,14 @@ class QuickEDAApp:
     
     def upload_error(self, error_msg):
         """Handle upload error"""
-        self.upload_progress.pack_forget()
+        self.stop_upload_progress()
         messagebox.showerror("Upload Error", f"Failed to load file:\n{error_msg}")
     
     def remove_file(self):
         """Remove uploaded file"""
         self.uploaded_file_path = None
         self.df = None
+        self.preview_df = None
         self.analysis_results = None
         self.report_generated = False
         
@@ -419,7 +864,7 @@ class QuickEDAApp:
     
     def analyze_data(self):
         """Analyze the uploaded data"""
-        if self.df is None or self.analysis_in_progress:
+        if self.uploaded_file_path is None or self.analysis_in_progress or self.report_in_progress:
             return
         
         self.analysis_in_progress = True
@@ -428,9 +873,16 @@ class QuickEDAApp:
         self.analysis_progress.set(0)
         self.analysis_status_label.configure(text="🔄 Analyzing data...")
         self.analyze_btn.configure(state="disabled", text="Analyzing...")
+        # Results are replaced by this run, so no report can be started meanwhile
+        self.download_btn.configure(state="disabled")
+        # The worker reads the file and replaces the data, so it can't be swapped or removed meanwhile
+        self.set_analysis_controls("disabled")
         
         # Run analysis in separate thread
-        thread = threading.Thread(target=self.process_analysis)
+        thread = threading.Thread(
+            target=self.process_analysis,
+            args=(self.df, self.uploaded_file_path, self.preview_df)
+        )
         thread.daemon = True
         thread.start()
     
@@ -438,29 +890,43 @@ class QuickEDAApp:
         """Update analysis progress from background thread"""
         self.analysis_progress.set(progress / 100)
         self.analysis_detail_label.configure(text=detail_text)
-        self.root.update_idletasks()
     
-    def process_analysis(self):
+    def set_analysis_controls(self, state):
+        """Enable or disable the controls that could change the data behind an analysis"""
+        self.upload_btn.configure(state=state)
+        self.remove_file_btn.configure(state=state)
+        self.reset_btn.configure(state=state)
+    
+    def process_analysis(self, df, file_path, preview_df):
         """Process data analysis with progress"""
         try:
-            analyzer = EDAAnalyzer(self.df)
+            # Text files are only previewed at upload; the analyzer loads them in full
+            # unless it finds cached results for the file
+            analyzer = EDAAnalyzer(
+                df, file_path, load_df=lambda: self.load_full_dataset(file_path, preview_df)
+            )
             
             # Perform actual analysis with progress updates
-            def progress_callback(progress, detail):
-                self.root.after(0, lambda: self.update_analysis_progress(progress, detail))
-                time.sleep(0.5)  # Add some delay to show progress
+            progress_callback = lambda progress, detail: self.root.after(
+                0, self.update_analysis_progress, progress, detail
+            )
             
             self.analysis_results = analyzer.perform_analysis(progress_callback)
+            if analyzer.loaded_df is not None:
+                self.df = analyzer.loaded_df
             
             # Update UI in main thread
+            # Cached results carry the full file's shape even when it was never loaded
+            self.root.after(0, self.update_file_info, self.analysis_results['shape'])
             self.root.after(0, self.analysis_success)
             
         except Exception as e:
-            self.root.after(0, lambda: self.analysis_error(str(e)))
+            self.root.after(0, self.analysis_error, str(e))
     
     def analysis_success(self):
         """Handle successful analysis"""
         self.analysis_in_progress = False
+        self.set_analysis_controls("normal")
         self.analysis_progress.pack_forget()
         self.analysis_detail_label.pack_forget()
         self.analysis_status_label.configure(text="✅ Analysis completed successfully!")
@@ -482,15 +948,18 @@ class QuickEDAApp:
     def analysis_error(self, error_msg):
         """Handle analysis error"""
         self.analysis_in_progress = False
+        self.set_analysis_controls("normal")
         self.analysis_progress.pack_forget()
         self.analysis_detail_label.pack_forget()
         self.analysis_status_label.configure(text="❌ Analysis failed")
         self.analyze_btn.configure(state="normal", text="Analyse Data")
+        if self.analysis_results:
+            self.download_btn.configure(state="normal")
         messagebox.showerror("Analysis Error", f"Failed to analyze data:\n{error_msg}")
     
     def download_report(self):
         """Download the EDA report as PDF"""
-        if not self.analysis_results:
+        if not self.analysis_results or self.report_in_progress:
             return
         
         filename = self.filename_entry.get().strip()
@@ -507,36 +976,71 @@ class QuickEDAApp:
         )
         
         if save_path:
-            try:
-                self.generate_pdf_report(save_path)
-                self.download_status_label.configure(text=f"✅ Report saved to: {os.path.basename(save_path)}")
-                ToastNotification(self.root, "Report saved successfully!")
-            except Exception as e:
-                messagebox.showerror("Save Error", f"Failed to save report:\n{str(e)}")
+            self.report_in_progress = True
+            self.set_report_controls("disabled")
+            self.download_btn.configure(text="Generating...")
+            self.download_status_label.configure(text="🔄 Generating report...")
+            
+            # Build the PDF in a separate thread from a snapshot of the current results
+            thread = threading.Thread(
+                target=self.process_report,
+                args=(save_path, self.analysis_results, self.uploaded_file_path)
+            )
+            thread.daemon = True
+            thread.start()
+    
+    def set_report_controls(self, state):
+        """Enable or disable the controls that could change the data behind a report"""
+        self.download_btn.configure(state=state)
+        self.analyze_btn.configure(state=state)
+        self.remove_file_btn.configure(state=state)
+        self.reset_btn.configure(state=state)
+    
+    def process_report(self, save_path, results, source_path):
+        """Generate the PDF report with page progress"""
+        try:
+            page_callback = lambda pages: self.root.after(0, self.update_report_progress, pages)
+            self.generate_pdf_report(save_path, results, source_path, page_callback)
+            
+            # Update UI in main thread
+            self.root.after(0, lambda: self.report_success(save_path))
+            
+        except Exception as e:
+            self.root.after(0, self.report_error, str(e))
+    
+    def update_report_progress(self, pages):
+        """Update report progress from background thread"""
+        self.download_status_label.configure(text=f"🔄 Generating report... page {pages}")
+    
+    def report_success(self, save_path):
+        """Handle successful report generation"""
+        self.report_generated = True
+        self.report_finished()
+        self.download_status_label.configure(text=f"✅ Report saved to: {os.path.basename(save_path)}")
+        ToastNotification(self.root, "Report saved successfully!")
+    
+    def report_error(self, error_msg):
+        """Handle report generation error"""
+        self.report_finished()
+        self.download_status_label.configure(text="❌ Report generation failed")
+        messagebox.showerror("Save Error", f"Failed to save report:\n{error_msg}")
     
-    def generate_pdf_report(self, save_path):
+    def report_finished(self):
+        """Re-enable the controls disabled while the report was generated"""
+        self.report_in_progress = False
+        self.set_report_controls("normal")
+        self.download_btn.configure(text="Download Report")
+    
+    def generate_pdf_report(self, save_path, results, source_path=None, page_callback=None):
         """Generate comprehensive PDF report"""
-        doc = SimpleDocTemplate(save_path, pagesize=A4)
-        styles = getSampleStyleSheet()
-        story = []
-        
-        # Custom styles
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Title'],
-            fontSize=24,
-            spaceAfter=30,
-            alignment=TA_CENTER
-        )
+        # ReportLab is only loaded once a report is requested, keeping app startup fast
+        from reportlab.lib.pagesizes import A4
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, LongTable, PageBreak
         
-        heading_style = ParagraphStyle(
-            'CustomHeading',
-            parent=styles['Heading1'],
-            fontSize=16,
-            spaceBefore=20,
-            spaceAfter=10,
-            textColor=colors.HexColor('#1f77b4')
-        )
+        doc = SimpleDocTemplate(save_path, pagesize=A4, pageCompression=1, author="QuickEDA")
+        styles, title_style, heading_style = report_styles()
+        header_style, column_style, numeric_style, top_values_style = table_styles()
+        story = []
         
         # Title
         story.append(Paragraph("Exploratory Data Analysis Report", title_style))
@@ -544,102 +1048,69 @@ class QuickEDAApp:
         
         # Generated info
         story.append(Paragraph(f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", styles['Normal']))
-        if self.uploaded_file_path:
-            story.append(Paragraph(f"Source file: {os.path.basename(self.uploaded_file_path)}", styles['Normal']))
+        if source_path:
+            story.append(Paragraph(f"Source file: {os.path.basename(source_path)}", styles['Normal']))
         story.append(Spacer(1, 20))
         
         # Dataset Overview
         story.append(Paragraph("Dataset Overview", heading_style))
         overview_data = [
             ['Metric', 'Value'],
-            ['Number of Rows', f"{self.analysis_results['shape'][0]:,}"],
-            ['Number of Columns', f"{self.analysis_results['shape'][1]}"],
-            ['Memory Usage', f"{self.analysis_results['memory_usage'] / 1024 / 1024:.2f} MB"],
-            ['Duplicate Rows', f"{self.analysis_results['duplicate_rows']:,}"]
+            ['Number of Rows', f"{results['shape'][0]:,}"],
+            ['Number of Columns', f"{results['shape'][1]}"],
+            ['Memory Usage', f"{results['memory_usage'] / 1024 / 1024:.2f} MB"
+                + (" (estimated from a sample)" if results['memory_estimated'] else "")],
+            ['Duplicate Rows', f"{results['duplicate_rows']:,}"]
         ]
         
         overview_table = Table(overview_data)
-        overview_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 12),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
+        overview_table.setStyle(header_style)
         story.append(overview_table)
         story.append(Spacer(1, 20))
         
         # Column Information
         story.append(Paragraph("Column Information", heading_style))
-        col_data = [['Column Name', 'Data Type', 'Missing Values', 'Missing %']]
-        
-        for col in self.analysis_results['columns']:
-            missing_count = self.analysis_results['missing_values'][col]
-            missing_pct = self.analysis_results['missing_percentage'][col]
-            col_data.append([
-                col,
-                str(self.analysis_results['dtypes'][col]),
-                str(missing_count),
-                f"{missing_pct:.1f}%"
-            ])
-        
-        col_table = Table(col_data)
-        col_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('FONTSIZE', (0, 1), (-1, -1), 8)
-        ]))
+        # Format whole columns at once rather than cell by cell
+        missing = pd.Series(results['missing_values'])
+        missing_pct = pd.Series(results['missing_percentage']).to_numpy(dtype=float)
+        col_info = np.column_stack([
+            missing.index.astype(str),
+            pd.Series(results['dtypes']).astype(str).to_numpy(),
+            missing.astype(str).to_numpy(),
+            np.char.mod('%.1f%%', missing_pct)
+        ])
+        col_data = [['Column Name', 'Data Type', 'Missing Values', 'Missing %']] + col_info.tolist()
+        
+        col_table = LongTable(col_data, repeatRows=1, colWidths=table_col_widths(col_data, 10, doc.width))
+        col_table.setStyle(column_style)
         story.append(col_table)
         
         # Numerical Summary
-        if 'numeric_summary' in self.analysis_results:
+        if 'numeric_summary' in results:
             story.append(PageBreak())
             story.append(Paragraph("Numerical Columns Summary", heading_style))
             
-            numeric_data = [['Column', 'Count', 'Mean', 'Std', 'Min', '25%', '50%', '75%', 'Max']]
+            num_df = pd.DataFrame(results['numeric_summary']).T
+            stat_values = num_df[['mean', 'std', 'min', '25%', '50%', '75%', 'max']].to_numpy(dtype=float)
+            num_info = np.column_stack([
+                num_df.index.astype(str),
+                np.char.mod('%.0f', num_df['count'].to_numpy(dtype=float)),
+                np.char.mod('%.2f', stat_values)
+            ])
+            numeric_data = [['Column', 'Count', 'Mean', 'Std', 'Min', '25%', '50%', '75%', 'Max']] + num_info.tolist()
             
-            for col, stats in self.analysis_results['numeric_summary'].items():
-                numeric_data.append([
-                    col,
-                    f"{stats['count']:.0f}",
-                    f"{stats['mean']:.2f}",
-                    f"{stats['std']:.2f}",
-                    f"{stats['min']:.2f}",
-                    f"{stats['25%']:.2f}",
-                    f"{stats['50%']:.2f}",
-                    f"{stats['75%']:.2f}",
-                    f"{stats['max']:.2f}"
-                ])
+            numeric_widths = table_col_widths(numeric_data, 8, doc.width)
             
-            numeric_table = Table(numeric_data)
-            numeric_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 8),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                ('FONTSIZE', (0, 1), (-1, -1), 7)
-            ]))
+            numeric_table = LongTable(numeric_data, repeatRows=1, colWidths=numeric_widths)
+            numeric_table.setStyle(numeric_style)
             story.append(numeric_table)
         
         # Categorical Summary
-        if 'categorical_summary' in self.analysis_results:
+        if 'categorical_summary' in results:
             story.append(Spacer(1, 20))
             story.append(Paragraph("Categorical Columns Summary", heading_style))
             
-            for col, info in self.analysis_results['categorical_summary'].items():
+            for col, info in results['categorical_summary'].items():
                 story.append(Paragraph(f"Column: {col}", styles['Heading2']))
                 story.append(Paragraph(f"Unique values: {info['unique_count']}", styles['Normal']))
                 
@@ -651,18 +1122,16 @@ class QuickEDAApp:
                         top_data.append([str(value)[:30], str(count)])  # Limit value length
                     
                     top_table = Table(top_data)
-                    top_table.setStyle(TableStyle([
-                        ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
-                        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                        ('FONTSIZE', (0, 0), (-1, -1), 9),
-                        ('GRID', (0, 0), (-1, -1), 1, colors.black)
-                    ]))
+                    top_table.setStyle(top_values_style)
                     story.append(top_table)
                     story.append(Spacer(1, 10))
         
-        # Generate PDF
-        doc.build(story)
+        # Generate PDF, reporting each page as it is rendered
+        def on_page(canvas, doc):
+            if page_callback:
+                page_callback(doc.page)
+        
+        doc.build(story, onFirstPage=on_page, onLaterPages=on_page)
     
     def reset_app(self):
         """Reset the application to initial state"""
@@ -675,14 +1144,9 @@ class QuickEDAApp:
 
 if __name__ == "__main__":
     # Check for required libraries
-    required_libs = ['customtkinter', 'pandas', 'reportlab', 'matplotlib', 'seaborn']
-    missing_libs = []
-    
-    for lib in required_libs:
-        try:
-            __import__(lib)
-        except ImportError:
-            missing_libs.append(lib)
+    required_libs = ['customtkinter', 'pandas', 'reportlab']
+    # Only locate the libraries here; importing reportlab would undo its lazy loading
+    missing_libs = [lib for lib in required_libs if importlib.util.find_spec(lib) is None]
     
     if missing_libs:
         print("Missing required libraries:")